@@ -14,19 +14,30 @@ from . import utils
 from .image import Image
 
 
-def lazy_property(fn):
+class lazy_property:
     """Decorator that makes a property lazy-evaluated
 
+    The value is computed on first access and stored in the instance
+    __dict__ under the property name.  Since this is a non-data descriptor,
+    later lookups are served directly from the instance __dict__.
+
     https://stevenloria.com/lazy-properties/
     """
-    attr_name = '_lazy_' + fn.__name__
-
-    @property
-    def _lazy_property(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, fn(self))
-        return getattr(self, attr_name)
-    return _lazy_property
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.attr_name = fn.__name__
+        self.__doc__ = fn.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attr_name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        value = self.fn(obj)
+        obj.__dict__[self.attr_name] = value
+        return value
 
 
 class Collection:
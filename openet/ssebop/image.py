@@ -17,19 +17,30 @@ PROJECT_FOLDER = 'projects/earthengine-legacy/assets/projects/usgs-ssebop'
 # PROJECT_FOLDER = 'projects/usgs-ssebop'
 
 
-def lazy_property(fn):
+class lazy_property:
     """Decorator that makes a property lazy-evaluated
 
+    The value is computed on first access and stored in the instance
+    __dict__ under the property name.  Since this is a non-data descriptor,
+    later lookups are served directly from the instance __dict__.
+
     https://stevenloria.com/lazy-properties/
     """
-    attr_name = '_lazy_' + fn.__name__
 
-    @property
-    def _lazy_property(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, fn(self))
-        return getattr(self, attr_name)
-    return _lazy_property
+    def __init__(self, fn):
+        self.fn = fn
+        self.attr_name = fn.__name__
+        self.__doc__ = fn.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attr_name = name
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        value = self.fn(obj)
+        obj.__dict__[self.attr_name] = value
+        return value
 
 
 class Image:
@@ -37,6 +48,38 @@ class Image:
 
     _C2_LST_CORRECT = True  # C2 LST correction to recalculate LST default value
 
+    # Landsat Collection 2 level 2 (SR) band names, scale factors, and offsets
+    _C2_SR_INPUT_BANDS = {
+        'LANDSAT_4': ['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B7',
+                      'ST_B6', 'QA_PIXEL', 'QA_RADSAT'],
+        'LANDSAT_5': ['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B7',
+                      'ST_B6', 'QA_PIXEL', 'QA_RADSAT'],
+        'LANDSAT_7': ['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B7',
+                      'ST_B6', 'QA_PIXEL', 'QA_RADSAT'],
+        'LANDSAT_8': ['SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7',
+                      'ST_B10', 'QA_PIXEL', 'QA_RADSAT'],
+        'LANDSAT_9': ['SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7',
+                      'ST_B10', 'QA_PIXEL', 'QA_RADSAT'],
+    }
+    _C2_SR_OUTPUT_BANDS = ['blue', 'green', 'red', 'nir', 'swir1', 'swir2',
+                           'lst', 'QA_PIXEL', 'QA_RADSAT']
+    _C2_SR_BAND_SCALE = [0.0000275, 0.0000275, 0.0000275, 0.0000275, 0.0000275, 0.0000275,
+                         0.00341802, 1, 1]
+    _C2_SR_BAND_OFFSET = [-0.2, -0.2, -0.2, -0.2, -0.2, -0.2, 149.0, 0, 0]
+
+    # Output band functions for the supported calculate() variables
+    _CALCULATE_VARIABLES = {
+        'et': lambda self: self.et.float(),
+        'et_fraction': lambda self: self.et_fraction.float(),
+        'et_reference': lambda self: self.et_reference.float(),
+        'lst': lambda self: self.lst.float(),
+        'mask': lambda self: self.mask,
+        'ndvi': lambda self: self.ndvi.float(),
+        # 'qa': lambda self: self.qa,
+        'quality': lambda self: self.quality,
+        'time': lambda self: self.time,
+    }
+
     def __init__(
             self, image,
             et_reference_source=None,
@@ -128,17 +171,7 @@ class Image:
             'image_id': self._id,
         }
 
-        # Build SCENE_ID from the (possibly merged) system:index
-        scene_id = ee.List(ee.String(self._index).split('_')).slice(-3)
-        self._scene_id = (
-            ee.String(scene_id.get(0)).cat('_')
-            .cat(ee.String(scene_id.get(1))).cat('_')
-            .cat(ee.String(scene_id.get(2)))
-        )
-
-        # Build WRS2_TILE from the scene_id
-        self._wrs2_tile = ee.String('p').cat(self._scene_id.slice(5, 8))\
-            .cat('r').cat(self._scene_id.slice(8, 11))
+        # The scene ID and WRS2 tile are lazy properties (see below)
 
         # Set server side date/time properties using the 'system:time_start'
         self._date = ee.Date(self._time_start)
@@ -247,6 +280,22 @@ class Image:
         else:
             self._tcorr_resample = 'bilinear'
 
+    @lazy_property
+    def _scene_id(self):
+        """SCENE_ID built from the (possibly merged) system:index"""
+        scene_id = ee.List(ee.String(self._index).split('_')).slice(-3)
+        return (
+            ee.String(scene_id.get(0)).cat('_')
+            .cat(ee.String(scene_id.get(1))).cat('_')
+            .cat(ee.String(scene_id.get(2)))
+        )
+
+    @lazy_property
+    def _wrs2_tile(self):
+        """WRS2_TILE built from the scene_id (i.e. p043r033)"""
+        return ee.String('p').cat(self._scene_id.slice(5, 8))\
+            .cat('r').cat(self._scene_id.slice(8, 11))
+
     def calculate(self, variables=['et', 'et_reference', 'et_fraction']):
         """Return a multiband image of calculated variables
 
@@ -261,26 +310,10 @@ class Image:
         """
         output_images = []
         for v in variables:
-            if v.lower() == 'et':
-                output_images.append(self.et.float())
-            elif v.lower() == 'et_fraction':
-                output_images.append(self.et_fraction.float())
-            elif v.lower() == 'et_reference':
-                output_images.append(self.et_reference.float())
-            elif v.lower() == 'lst':
-                output_images.append(self.lst.float())
-            elif v.lower() == 'mask':
-                output_images.append(self.mask)
-            elif v.lower() == 'ndvi':
-                output_images.append(self.ndvi.float())
-            # elif v.lower() == 'qa':
-            #     output_images.append(self.qa)
-            elif v.lower() == 'quality':
-                output_images.append(self.quality)
-            elif v.lower() == 'time':
-                output_images.append(self.time)
-            else:
+            variable_func = self._CALCULATE_VARIABLES.get(v.lower())
+            if variable_func is None:
                 raise ValueError(f'unsupported variable: {v}')
+            output_images.append(variable_func(self))
 
         return ee.Image(output_images).set(self._properties)
 
@@ -319,11 +352,11 @@ class Image:
                     time_start=self._time_start,
                 )
 
-        return et_fraction.set(self._properties)\
-            .set({
-                'tcorr_index': self.tcorr.get('tcorr_index'),
-                'et_fraction_type': self.et_fraction_type.lower()
-            })
+        return et_fraction.set({
+            **self._properties,
+            'tcorr_index': self.tcorr.get('tcorr_index'),
+            'et_fraction_type': self.et_fraction_type.lower(),
+        })
 
     @lazy_property
     def et_reference(self):
@@ -450,8 +483,9 @@ class Image:
     @lazy_property
     def mask(self):
         """Mask of all active pixels (based on the final et_fraction)"""
+        # 1 for all pixels where the et_fraction is unmasked
         return (
-            self.et_fraction.multiply(0).add(1).updateMask(1)
+            self.et_fraction.mask().gt(0).selfMask()
             .rename(['mask']).set(self._properties).uint8()
         )
 
@@ -504,9 +538,11 @@ class Image:
     @lazy_property
     def time(self):
         """Return an image of the 0 UTC time (in milliseconds)"""
+        # The mask image is 1 for all active pixels, so scaling it by the time
+        #   gives the time value for all active pixels
         return (
             self.mask
-            .double().multiply(0).add(utils.date_to_time_0utc(self._date))
+            .double().multiply(utils.date_to_time_0utc(self._date))
             .rename(['time']).set(self._properties)
         )
 
@@ -664,22 +700,20 @@ class Image:
 
         """
         collection_methods = {
-            'LANDSAT/LT04/C02/T1_L2': 'from_landsat_c2_sr',
-            'LANDSAT/LT05/C02/T1_L2': 'from_landsat_c2_sr',
-            'LANDSAT/LE07/C02/T1_L2': 'from_landsat_c2_sr',
-            'LANDSAT/LC08/C02/T1_L2': 'from_landsat_c2_sr',
-            'LANDSAT/LC09/C02/T1_L2': 'from_landsat_c2_sr',
+            'LANDSAT/LT04/C02/T1_L2': cls.from_landsat_c2_sr,
+            'LANDSAT/LT05/C02/T1_L2': cls.from_landsat_c2_sr,
+            'LANDSAT/LE07/C02/T1_L2': cls.from_landsat_c2_sr,
+            'LANDSAT/LC08/C02/T1_L2': cls.from_landsat_c2_sr,
+            'LANDSAT/LC09/C02/T1_L2': cls.from_landsat_c2_sr,
         }
 
         try:
-            method_name = collection_methods[image_id.rsplit('/', 1)[0]]
+            method = collection_methods[image_id.rsplit('/', 1)[0]]
         except KeyError:
             raise ValueError(f'unsupported collection ID: {image_id}')
         except Exception as e:
             raise Exception(f'unhandled exception: {e}')
 
-        method = getattr(Image, method_name)
-
         return method(ee.Image(image_id), **kwargs)
 
     @classmethod
@@ -710,26 +744,10 @@ class Image:
         # Rename bands to generic names
         # Include QA_RADSAT and SR_CLOUD_QA bands to apply additional cloud masking
         #   in openet.core.common.landsat_c2_sr_cloud_mask()
-        input_bands = ee.Dictionary({
-            'LANDSAT_4': ['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B7',
-                          'ST_B6', 'QA_PIXEL', 'QA_RADSAT'],
-            'LANDSAT_5': ['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B7',
-                          'ST_B6', 'QA_PIXEL', 'QA_RADSAT'],
-            'LANDSAT_7': ['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B7',
-                          'ST_B6', 'QA_PIXEL', 'QA_RADSAT'],
-            'LANDSAT_8': ['SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7',
-                          'ST_B10', 'QA_PIXEL', 'QA_RADSAT'],
-            'LANDSAT_9': ['SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7',
-                          'ST_B10', 'QA_PIXEL', 'QA_RADSAT'],
-        })
-        output_bands = ['blue', 'green', 'red', 'nir', 'swir1', 'swir2',
-                        'lst', 'QA_PIXEL', 'QA_RADSAT']
-        band_scale = [0.0000275, 0.0000275, 0.0000275, 0.0000275, 0.0000275, 0.0000275,
-                      0.00341802, 1, 1]
-        band_offset = [-0.2, -0.2, -0.2, -0.2, -0.2, -0.2, 149.0, 0, 0]
+        input_bands = ee.Dictionary(cls._C2_SR_INPUT_BANDS)
         prep_image = (
-            sr_image.select(input_bands.get(spacecraft_id), output_bands)
-            .multiply(band_scale).add(band_offset)
+            sr_image.select(input_bands.get(spacecraft_id), cls._C2_SR_OUTPUT_BANDS)
+            .multiply(cls._C2_SR_BAND_SCALE).add(cls._C2_SR_BAND_OFFSET)
         )
 
         # Default the cloudmask flags to True if they were not
@@ -760,15 +778,18 @@ class Image:
         else:
             c2_lst_correct = cls._C2_LST_CORRECT
 
+        # Compute NDVI once since it is used for the LST correction and as an input band
+        ndvi = landsat.ndvi(prep_image)
+
         if c2_lst_correct:
-            lst = openet.core.common.landsat_c2_sr_lst_correct(sr_image, landsat.ndvi(prep_image))
+            lst = openet.core.common.landsat_c2_sr_lst_correct(sr_image, ndvi)
         else:
             lst = prep_image.select(['lst'])
 
         # Build the input image
         input_image = ee.Image([
             lst,
-            landsat.ndvi(prep_image),
+            ndvi,
             landsat.ndwi(prep_image),
             landsat.landsat_c2_qa_water_mask(prep_image),
         ])
@@ -847,6 +868,7 @@ class Image:
         water_pct = 50
         # max pixels argument for .reduceResolution()
         m_pixels = 65535
+        crs = self.crs
 
         lst = ee.Image(self.lst)
         ndvi = ee.Image(self.ndvi).clamp(-1.0, 1.0)
@@ -862,74 +884,60 @@ class Image:
         not_water_mask = self.tcorr_not_water_mask
 
         # Count not-water pixels and the total number of pixels
-        # TODO: Rename "watermask_coarse_count" here to "not_water_pixels_count"
-        watermask_coarse_count = (
-            self.qa_water_mask.updateMask(not_water_mask)
-            .reduceResolution(ee.Reducer.count(), False, m_pixels)
-            .reproject(self.crs, coarse_transform)
-            .updateMask(1).select([0], ['count'])
-        )
-
+        #   in a single two band reduceResolution pass
         # TODO: Maybe chance ndvi to self.qa_water_mask?
-        total_pixels_count = (
-            ndvi
+        pixels_count = (
+            ee.Image([self.qa_water_mask.updateMask(not_water_mask), ndvi])
             .reduceResolution(ee.Reducer.count(), False, m_pixels)
-            .reproject(self.crs, coarse_transform)
-            .updateMask(1).select([0], ['count'])
+            .reproject(crs, coarse_transform)
+            .updateMask(1)
         )
+        # TODO: Rename "watermask_coarse_count" here to "not_water_pixels_count"
+        watermask_coarse_count = pixels_count.select([0], ['count'])
+        total_pixels_count = pixels_count.select([1], ['count'])
 
-        # Doing a layering mosaic check to fill any remaining Null watermask coarse pixels with valid mask data.
+        # Fill any remaining Null watermask coarse pixels with a count of 1.
         #   This can happen if the reduceResolution count contained exclusively water pixels from 30 meters.
-        watermask_coarse_count = (
-            ee.Image([watermask_coarse_count, total_pixels_count.multiply(0).add(1)])
-            .reduce(ee.Reducer.firstNonNull())
-        )
+        # Coarse pixels with no input pixels at all are also filled here, but they are
+        #   masked again by the divide by total_pixels_count below.
+        watermask_coarse_count = watermask_coarse_count.unmask(1, False)
 
         percentage_bad = watermask_coarse_count.divide(total_pixels_count)
         pct_value = (1 - (water_pct / 100))
         wet_region_mask_5km = percentage_bad.lte(pct_value)
 
-        ndvi_avg_masked = (
-            ndvi
-            .updateMask(not_water_mask)
-            .reduceResolution(ee.Reducer.mean(), False, m_pixels)
-            .reproject(self.crs, coarse_transform)
-        )
-        ndvi_avg_masked100 = (
-            ndvi
-            .updateMask(not_water_mask)
-            .reduceResolution(ee.Reducer.mean(), True, m_pixels)
-            .reproject(self.crs, coarse_transform100)
-        )
-        ndvi_avg_unmasked = (
-            ndvi
-            .reduceResolution(ee.Reducer.mean(), False, m_pixels)
-            .reproject(self.crs, coarse_transform)
-            .updateMask(1)
-        )
-        lst_avg_masked = (
-            lst
+        # NDVI and LST are aggregated together as a two band image so that each
+        #   reduceResolution pass reads the shared 30m inputs once
+        ndvi_lst = ee.Image([ndvi, lst])
+        ndvi_lst_avg_masked = (
+            ndvi_lst
             .updateMask(not_water_mask)
             .reduceResolution(ee.Reducer.mean(), False, m_pixels)
-            .reproject(self.crs, coarse_transform)
+            .reproject(crs, coarse_transform)
         )
-        lst_avg_masked100 = (
-            lst
+        ndvi_lst_avg_masked100 = (
+            ndvi_lst
             .updateMask(not_water_mask)
             .reduceResolution(ee.Reducer.mean(), True, m_pixels)
-            .reproject(self.crs, coarse_transform100)
+            .reproject(crs, coarse_transform100)
         )
-        lst_avg_unmasked = (
-            lst
+        ndvi_lst_avg_unmasked = (
+            ndvi_lst
             .reduceResolution(ee.Reducer.mean(), False, m_pixels)
-            .reproject(self.crs, coarse_transform)
+            .reproject(crs, coarse_transform)
             .updateMask(1)
         )
+        ndvi_avg_masked = ndvi_lst_avg_masked.select([0])
+        ndvi_avg_masked100 = ndvi_lst_avg_masked100.select([0])
+        ndvi_avg_unmasked = ndvi_lst_avg_unmasked.select([0])
+        lst_avg_masked = ndvi_lst_avg_masked.select([1])
+        lst_avg_masked100 = ndvi_lst_avg_masked100.select([1])
+        lst_avg_unmasked = ndvi_lst_avg_unmasked.select([1])
 
         # Here we don't need the reproject.reduce.reproject sandwich bc these are coarse data-sets
-        dt_avg = dt.reproject(self.crs, coarse_transform)
-        dt_avg100 = dt.reproject(self.crs, coarse_transform100).updateMask(1)
-        tmax_avg = tmax.reproject(self.crs, coarse_transform)
+        dt_avg = dt.reproject(crs, coarse_transform)
+        dt_avg100 = dt.reproject(crs, coarse_transform100).updateMask(1)
+        tmax_avg = tmax.reproject(crs, coarse_transform)
 
         # FANO expression as a function of dT, calculated at the coarse resolution(s)
         Tc_warm = lst_avg_masked.expression(
@@ -81,11 +81,13 @@ def lst(landsat_image):
     rsky = 1.32   # narrow band clear sky downward thermal radiation
 
     """
+    landsat_image = ee.Image(landsat_image)
+
     # Get properties from image
-    k1 = ee.Number(ee.Image(landsat_image).get('k1_constant'))
-    k2 = ee.Number(ee.Image(landsat_image).get('k2_constant'))
+    k1 = ee.Number(landsat_image.get('k1_constant'))
+    k2 = ee.Number(landsat_image.get('k2_constant'))
 
-    ts_brightness = ee.Image(landsat_image).select(['tir'])
+    ts_brightness = landsat_image.select(['tir'])
     emissivity_img = emissivity(landsat_image)
 
     # First back out radiance from brightness temperature
@@ -33,10 +33,7 @@ def et_fraction(lst, tmax, tcorr, dt):
 
     """
 
-    etf = lst.expression(
-        '(lst * (-1) + tmax * tcorr + dt) / dt',
-        {'tmax': tmax, 'dt': dt, 'lst': lst, 'tcorr': tcorr}
-    )
+    etf = ee.Image(tmax).multiply(tcorr).add(dt).subtract(lst).divide(dt)
 
     return etf.updateMask(etf.lte(2.0)).clamp(0, 1.0).rename(['et_fraction'])
 
@@ -164,12 +161,14 @@ def lapse_adjust(temperature, elev, lapse_threshold=1500):
     ee.Image
 
     """
-    elr_adjust = ee.Image(temperature).expression(
+    temperature = ee.Image(temperature)
+
+    elr_adjust = temperature.expression(
         '(temperature - (0.003 * (elev - threshold)))',
         {'temperature': temperature, 'elev': elev, 'threshold': lapse_threshold}
     )
 
-    return ee.Image(temperature).where(elev.gt(lapse_threshold), elr_adjust)
+    return temperature.where(elev.gt(lapse_threshold), elr_adjust)
 
 
 def elr_adjust(temperature, elevation, radius=80):
@@ -291,19 +290,17 @@ def etf_grass_type_adjust(etf, src_coll_id, time_start, resample_method='bilinea
     #     hourly_coll.filterDate(self._date.advance(-1, 'hour'), self._date).first()
     # )
 
+    # Build the hourly reference ET object once so the etr and eto
+    #   calculations share the same input preprocessing
     if src_coll_id.upper() == 'NASA/NLDAS/FORA0125_H002':
-        ratio = (
-            openet.refetgee.Hourly.nldas(interp_img).etr
-            .divide(openet.refetgee.Hourly.nldas(interp_img).eto)
-        )
+        hourly = openet.refetgee.Hourly.nldas(interp_img)
+        ratio = hourly.etr.divide(hourly.eto)
         if resample_method and (resample_method.lower() in ['bilinear', 'bicubic']):
             ratio = ratio.resample(resample_method)
         etf_grass = etf.multiply(ratio)
     elif src_coll_id.upper() == 'ECMWF/ERA5_LAND/HOURLY':
-        ratio = (
-            openet.refetgee.Hourly.era5_land(interp_img).etr
-            .divide(openet.refetgee.Hourly.era5_land(interp_img).eto)
-        )
+        hourly = openet.refetgee.Hourly.era5_land(interp_img)
+        ratio = hourly.etr.divide(hourly.eto)
         if resample_method and (resample_method.lower() in ['bilinear', 'bicubic']):
             ratio = ratio.resample(resample_method)
         etf_grass = etf.multiply(ratio)